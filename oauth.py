@@ -1,89 +1,95 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 def create_directory(path):
-    os.makedirs(path, exist_ok=True)
+    path.mkdir(parents=True, exist_ok=True)
 
 def create_file(path):
-    with open(path, 'w') as f:
-        pass
-
-# Define base path
-base_path = "apps/web/modules/s3-storage-module"
-
-# Create main directory
-create_directory(base_path)
-
-# Create main files
-create_file(os.path.join(base_path, "package.json"))
-create_file(os.path.join(base_path, "manifest.json"))
-create_file(os.path.join(base_path, "index.js"))
-create_file(os.path.join(base_path, "install.js"))
-create_file(os.path.join(base_path, "uninstall.js"))
-create_file(os.path.join(base_path, "README.md"))
-create_file(os.path.join(base_path, "icon.png"))
-create_file(os.path.join(base_path, "screenshot1.png"))
-create_file(os.path.join(base_path, "screenshot2.png"))
-
-# Create config directory and files
-config_path = os.path.join(base_path, "config")
-create_directory(config_path)
-create_file(os.path.join(config_path, "providers.json"))
-create_file(os.path.join(config_path, "defaults.json"))
-
-# Create services directory and files
-services_path = os.path.join(base_path, "services")
-create_directory(services_path)
-create_file(os.path.join(services_path, "s3-storage-service.js"))
-create_file(os.path.join(services_path, "provider-factory.js"))
-create_file(os.path.join(services_path, "file-manager.js"))
-create_file(os.path.join(services_path, "url-service.js"))
-
-# Create providers directory and files
-providers_path = os.path.join(base_path, "providers")
-create_directory(providers_path)
-create_file(os.path.join(providers_path, "aws-s3.js"))
-create_file(os.path.join(providers_path, "vultr-storage.js"))
-create_file(os.path.join(providers_path, "cloudflare-r2.js"))
-create_file(os.path.join(providers_path, "digitalocean-spaces.js"))
-create_file(os.path.join(providers_path, "linode-storage.js"))
-create_file(os.path.join(providers_path, "base-provider.js"))
-
-# Create utils directory and files
-utils_path = os.path.join(base_path, "utils")
-create_directory(utils_path)
-create_file(os.path.join(utils_path, "validators.js"))
-create_file(os.path.join(utils_path, "file-utils.js"))
-create_file(os.path.join(utils_path, "mime-helper.js"))
-create_file(os.path.join(utils_path, "error-handler.js"))
-
-# Create middleware directory and files
-middleware_path = os.path.join(base_path, "middleware")
-create_directory(middleware_path)
-create_file(os.path.join(middleware_path, "storage-interceptor.js"))
-create_file(os.path.join(middleware_path, "upload-handler.js"))
-
-# Create admin directory and files
-admin_path = os.path.join(base_path, "admin")
-create_directory(admin_path)
-create_file(os.path.join(admin_path, "settings-panel.js"))
-create_file(os.path.join(admin_path, "storage-stats.js"))
-create_file(os.path.join(admin_path, "migration-tool.js"))
-create_file(os.path.join(admin_path, "test-connection.js"))
-
-# Create api directory and files
-api_path = os.path.join(base_path, "api")
-create_directory(api_path)
-create_file(os.path.join(api_path, "upload.js"))
-create_file(os.path.join(api_path, "delete.js"))
-create_file(os.path.join(api_path, "migrate.js"))
-create_file(os.path.join(api_path, "test-connection.js"))
-create_file(os.path.join(api_path, "settings.js"))
-
-# Create hooks directory and files
-hooks_path = os.path.join(base_path, "hooks")
-create_directory(hooks_path)
-create_file(os.path.join(hooks_path, "media-upload.js"))
-create_file(os.path.join(hooks_path, "media-delete.js"))
-create_file(os.path.join(hooks_path, "url-generation.js"))
-
-print(f"Folder structure and empty files created successfully at {base_path}")
\ No newline at end of file
+    # Leave existing files (and symlinks) alone on re-runs
+    if not os.path.lexists(path):
+        path.touch()
+
+# Leaf directories under base_path; mkdir(parents=True) creates the ancestors,
+# including base_path itself, so one call per leaf is enough
+DIRS = ("config", "services", "providers", "utils", "middleware", "admin", "api", "hooks")
+
+# (directory, file) pairs; an empty directory means base_path itself
+FILES = (
+    # Main files
+    ("", "package.json"),
+    ("", "manifest.json"),
+    ("", "index.js"),
+    ("", "install.js"),
+    ("", "uninstall.js"),
+    ("", "README.md"),
+    ("", "icon.png"),
+    ("", "screenshot1.png"),
+    ("", "screenshot2.png"),
+
+    # Config
+    ("config", "providers.json"),
+    ("config", "defaults.json"),
+
+    # Services
+    ("services", "s3-storage-service.js"),
+    ("services", "provider-factory.js"),
+    ("services", "file-manager.js"),
+    ("services", "url-service.js"),
+
+    # Providers
+    ("providers", "aws-s3.js"),
+    ("providers", "vultr-storage.js"),
+    ("providers", "cloudflare-r2.js"),
+    ("providers", "digitalocean-spaces.js"),
+    ("providers", "linode-storage.js"),
+    ("providers", "base-provider.js"),
+
+    # Utils
+    ("utils", "validators.js"),
+    ("utils", "file-utils.js"),
+    ("utils", "mime-helper.js"),
+    ("utils", "error-handler.js"),
+
+    # Middleware
+    ("middleware", "storage-interceptor.js"),
+    ("middleware", "upload-handler.js"),
+
+    # Admin
+    ("admin", "settings-panel.js"),
+    ("admin", "storage-stats.js"),
+    ("admin", "migration-tool.js"),
+    ("admin", "test-connection.js"),
+
+    # API
+    ("api", "upload.js"),
+    ("api", "delete.js"),
+    ("api", "migrate.js"),
+    ("api", "test-connection.js"),
+    ("api", "settings.js"),
+
+    # Hooks
+    ("hooks", "media-upload.js"),
+    ("hooks", "media-delete.js"),
+    ("hooks", "url-generation.js"),
+)
+
+def create_s3_structure(base_path="apps/web/modules/s3-storage-module"):
+    root = Path(base_path)
+
+    # Build each directory path once and reuse it for every file inside it
+    dir_paths = {"": root}
+    for d in DIRS:
+        dir_paths[d] = root / d
+        create_directory(dir_paths[d])
+
+    # The directories above already exist, so the file creations are
+    # independent and can run concurrently
+    all_files = [dir_paths[d] / f for d, f in FILES]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(create_file, all_files))
+
+    print(f"Folder structure and empty files created successfully at {base_path}")
+
+if __name__ == "__main__":
+    create_s3_structure()